@@ -1,17 +1,23 @@
 import os
 import sqlite3
 import sys
-from datetime import datetime, date
+from datetime import datetime, date, timedelta, timezone
+from functools import lru_cache
+from pathlib import Path
 from typing import Optional, List, Dict
 
 import requests
+from requests.adapters import HTTPAdapter, Retry
 from dateutil.parser import parse as parse_date
 
-from PySide6.QtCore import Qt, QDate, QPropertyAnimation, QEasingCurve, QRect
+from PySide6.QtCore import (
+    Qt, QDate, QPropertyAnimation, QEasingCurve, QRect, QTimer,
+    QAbstractTableModel, QModelIndex, QObject, QRunnable, QThreadPool, Signal
+)
 from PySide6.QtGui import QAction, QFontDatabase, QIcon, QColor, QFont
 from PySide6.QtWidgets import (
     QApplication, QMainWindow, QWidget, QTabWidget, QVBoxLayout, QHBoxLayout,
-    QLabel, QLineEdit, QPushButton, QComboBox, QTableWidget, QTableWidgetItem,
+    QLabel, QLineEdit, QPushButton, QComboBox, QTableView,
     QDateEdit, QCheckBox, QMessageBox, QDoubleSpinBox, QFormLayout,
     QGroupBox, QFrame, QGridLayout, QGraphicsDropShadowEffect
 )
@@ -27,15 +33,29 @@ ACCOUNT_TYPES = ["fixed", "liquid"]
 ASSETS_DIR = os.path.join(os.path.dirname(__file__), "assets")
 ICON_DIR = os.path.join(ASSETS_DIR, "icons")
 
+def _now_iso() -> str:
+    # strftime is cheaper than isoformat() and keeps timestamps second-granular;
+    # batch inserts call this once and reuse the string for every row
+    return datetime.now(timezone.utc).strftime("%Y-%m-%dT%H:%M:%S")
+
 # --------------------- Database Layer ---------------------
 class DB:
     def __init__(self, path: str):
-        self.conn = sqlite3.connect(path)
+        # isolation_level=None -> autocommit; multi-statement ops use explicit BEGIN/COMMIT
+        self.conn = sqlite3.connect(path, isolation_level=None)
         self.conn.row_factory = sqlite3.Row
+        # WAL + NORMAL avoids a full-database fsync on every insert
+        self.conn.execute("PRAGMA journal_mode=WAL")
+        self.conn.execute("PRAGMA synchronous=NORMAL")
+        self.conn.execute("PRAGMA temp_store=MEMORY")
+        self.conn.execute("PRAGMA cache_size=-20000")
+        self.conn.execute("PRAGMA foreign_keys=ON")
         self.init_schema()
 
     def init_schema(self):
         c = self.conn.cursor()
+        # One transaction for all DDL + seeds: single fsync on startup
+        c.execute("BEGIN")
         c.execute("""CREATE TABLE IF NOT EXISTS accounts(
             id INTEGER PRIMARY KEY AUTOINCREMENT,
             name TEXT NOT NULL UNIQUE,
@@ -48,7 +68,8 @@ class DB:
             id INTEGER PRIMARY KEY AUTOINCREMENT,
             name TEXT NOT NULL,
             kind TEXT NOT NULL CHECK(kind IN ('expense','income')),
-            is_default INTEGER NOT NULL DEFAULT 0
+            is_default INTEGER NOT NULL DEFAULT 0,
+            UNIQUE(name, kind)
         )""")
         c.execute("""CREATE TABLE IF NOT EXISTS expenses(
             id INTEGER PRIMARY KEY AUTOINCREMENT,
@@ -77,11 +98,40 @@ class DB:
             key TEXT PRIMARY KEY,
             value TEXT
         )""")
-        self.conn.commit()
-        self.seed_defaults()
-
-    def seed_defaults(self):
-        c = self.conn.cursor()
+        c.execute("""CREATE TABLE IF NOT EXISTS fx_rates(
+            base TEXT NOT NULL,
+            target TEXT NOT NULL,
+            rate REAL NOT NULL,
+            fetched_at TEXT NOT NULL,
+            PRIMARY KEY(base, target)
+        )""")
+        # Indexes for the dashboard filters (date ranges + upcoming flags)
+        c.execute("CREATE INDEX IF NOT EXISTS idx_expenses_date ON expenses(date)")
+        c.execute("CREATE INDEX IF NOT EXISTS idx_expenses_upcoming ON expenses(is_upcoming) WHERE is_upcoming=1")
+        c.execute("CREATE INDEX IF NOT EXISTS idx_incomes_date ON incomes(expected_date)")
+        c.execute("CREATE INDEX IF NOT EXISTS idx_incomes_upcoming ON incomes(is_upcoming) WHERE is_upcoming=1")
+        c.execute("CREATE INDEX IF NOT EXISTS idx_accounts_type_cur ON accounts(type, currency)")
+        # Databases created before UNIQUE(name,kind) was in the DDL never got the
+        # constraint, so INSERT OR IGNORE seeding duplicated the defaults on every
+        # launch. Repair once (keeping the oldest row per pair and repointing any
+        # expenses at it), then enforce uniqueness via an index that covers
+        # legacy schemas too.
+        if not c.execute("SELECT 1 FROM sqlite_master WHERE type='index' "
+                         "AND name='idx_categories_name_kind'").fetchone():
+            c.execute("""UPDATE expenses SET category_id = (
+                SELECT MIN(c2.id) FROM categories c1 JOIN categories c2
+                ON c2.name = c1.name AND c2.kind = c1.kind
+                WHERE c1.id = expenses.category_id)
+                WHERE category_id IN (SELECT id FROM categories)""")
+            c.execute("""DELETE FROM categories WHERE id NOT IN (
+                SELECT MIN(id) FROM categories GROUP BY name, kind)""")
+        c.execute("CREATE UNIQUE INDEX IF NOT EXISTS idx_categories_name_kind "
+                  "ON categories(name, kind)")
+        self.seed_defaults(c)
+        c.execute("COMMIT")
+        c.execute("ANALYZE")
+
+    def seed_defaults(self, c):
         defaults = [
             ("Groceries", "expense", 1),
             ("Rent", "expense", 1),
@@ -94,15 +144,12 @@ class DB:
             ("Freelance", "income", 1),
             ("Investment", "income", 1),
         ]
-        for name, kind, is_default in defaults:
-            c.execute("SELECT 1 FROM categories WHERE name=? AND kind=?", (name, kind))
-            if not c.fetchone():
-                c.execute("INSERT INTO categories(name, kind, is_default) VALUES(?,?,?)",
-                          (name, kind, is_default))
-        c.execute("SELECT 1 FROM settings WHERE key='display_currency'")
-        if not c.fetchone():
-            c.execute("INSERT INTO settings(key,value) VALUES('display_currency','BDT')")
-        self.conn.commit()
+        # One multi-row INSERT OR IGNORE; UNIQUE(name,kind) replaces the
+        # per-category SELECT-then-INSERT round-trips
+        placeholders = ",".join(["(?,?,?)"] * len(defaults))
+        c.execute(f"INSERT OR IGNORE INTO categories(name,kind,is_default) VALUES {placeholders}",
+                  tuple(v for row in defaults for v in row))
+        c.execute("INSERT OR IGNORE INTO settings(key,value) VALUES('display_currency','BDT')")
 
     def query(self, sql: str, params: tuple = ()):
         cur = self.conn.cursor()
@@ -115,47 +162,157 @@ class DB:
         self.conn.commit()
         return cur.lastrowid
 
+    def fetchall(self, sql: str, params: tuple = ()):
+        # Connection.execute reuses sqlite3's internal statement cache without
+        # allocating a fresh cursor per call
+        return self.conn.execute(sql, params).fetchall()
+
+    def query_tuples(self, sql: str, params: tuple = ()):
+        # Plain tuples skip sqlite3.Row's per-access column-name resolution;
+        # use for hot loops that unpack positionally
+        cur = self.conn.cursor()
+        cur.row_factory = None
+        cur.execute(sql, params)
+        return cur.fetchall()
+
+    def executemany(self, sql: str, seq_of_params):
+        cur = self.conn.cursor()
+        cur.execute("BEGIN")
+        try:
+            cur.executemany(sql, seq_of_params)
+            cur.execute("COMMIT")
+        except Exception:
+            cur.execute("ROLLBACK")
+            raise
+
 # --------------------- Currency Service ---------------------
-class CurrencyService:
+RATE_TTL = timedelta(hours=12)
+
+class _RateFetcherSignals(QObject):
+    done = Signal(str, str, float)
+    failed = Signal(str, str)
+
+class RateFetcher(QRunnable):
+    """Fetches one rate off the GUI thread so a cache miss never blocks paint."""
+    def __init__(self, http, base: str, target: str):
+        super().__init__()
+        self.http = http
+        self.base = base
+        self.target = target
+        self.signals = _RateFetcherSignals()
+
+    def run(self):
+        try:
+            url = f"https://api.exchangerate.host/latest?base={self.base}&symbols={self.target}"
+            resp = self.http.get(url, timeout=3)
+            if resp.status_code == 200:
+                rate = float(resp.json()["rates"][self.target])
+                self.signals.done.emit(self.base, self.target, rate)
+                return
+        except Exception:
+            pass
+        self.signals.failed.emit(self.base, self.target)
+
+class CurrencyService(QObject):
+    # Emitted on the GUI thread after a background fetch lands in the cache
+    rate_updated = Signal(str, str, float)
+
     def __init__(self, db: DB):
+        super().__init__()
         self.db = db
+        # (base, target) -> (rate, fetched_at); persisted in fx_rates across runs
         self.cache = {}
+        self._pending = set()  # pairs with a fetch already in flight
+        for r in self.db.query("SELECT base, target, rate, fetched_at FROM fx_rates"):
+            ts = datetime.fromisoformat(r["fetched_at"])
+            if ts.tzinfo is None:  # rows written before fetched_at was tz-aware
+                ts = ts.replace(tzinfo=timezone.utc)
+            self.cache[(r["base"], r["target"])] = (r["rate"], ts)
+        self._display_cur: Optional[str] = None
         self.fallback_rate = {
             ("USD", "BDT"): 120.0,
             ("BDT", "USD"): 1/120.0
         }
+        # Persistent session so repeated rate lookups reuse the TCP/TLS connection
+        self.http = requests.Session()
+        self.http.headers["User-Agent"] = "FinX/1.0"
+        adapter = HTTPAdapter(pool_connections=4, pool_maxsize=8,
+                              max_retries=Retry(total=2, backoff_factor=0.3))
+        self.http.mount("https://", adapter)
+        self.http.mount("http://", adapter)
+
+    def close(self):
+        self.http.close()
 
     def get_display_currency(self) -> str:
-        row = self.db.query("SELECT value FROM settings WHERE key='display_currency'")
-        return row[0]["value"] if row else "BDT"
+        if self._display_cur is None:
+            row = self.db.query("SELECT value FROM settings WHERE key='display_currency'")
+            self._display_cur = row[0]["value"] if row else "BDT"
+        return self._display_cur
 
     def set_display_currency(self, cur: str):
         if cur not in SUPPORTED_CURRENCIES:
             raise ValueError("Unsupported display currency")
         self.db.execute("INSERT OR REPLACE INTO settings(key,value) VALUES('display_currency',?)", (cur,))
+        self._display_cur = cur
 
     def fetch_rate(self, base: str, target: str) -> float:
         if base == target:
             return 1.0
         key = (base, target)
-        if key in self.cache:
-            return self.cache[key]
-        try:
-            url = f"https://api.exchangerate.host/latest?base={base}&symbols={target}"
-            resp = requests.get(url, timeout=3)
-            if resp.status_code == 200:
-                data = resp.json()
-                rate = float(data["rates"][target])
-                self.cache[key] = rate
-                return rate
-        except Exception:
-            pass
+        cached = self.cache.get(key)
+        if cached and datetime.now(timezone.utc) - cached[1] < RATE_TTL:
+            return cached[0]
+        # Kick off a background refresh and return the best value we have now;
+        # rate_updated fires once the real rate arrives.
+        if key not in self._pending:
+            self._pending.add(key)
+            fetcher = RateFetcher(self.http, base, target)
+            fetcher.signals.done.connect(self._store_rate)
+            fetcher.signals.failed.connect(self._fetch_failed)
+            QThreadPool.globalInstance().start(fetcher)
+        if cached:  # stale entry still beats the hardcoded fallback
+            return cached[0]
         return self.fallback_rate.get(key, 1.0)
 
+    def _store_rate(self, base: str, target: str, rate: float):
+        now = datetime.now(timezone.utc)
+        self.cache[(base, target)] = (rate, now)
+        self.db.execute(
+            "INSERT OR REPLACE INTO fx_rates(base,target,rate,fetched_at) VALUES(?,?,?,?)",
+            (base, target, rate, now.isoformat())
+        )
+        self._pending.discard((base, target))
+        self.rate_updated.emit(base, target, rate)
+
+    def _fetch_failed(self, base: str, target: str):
+        self._pending.discard((base, target))
+
     def convert(self, amount: float, base: str, target: str) -> float:
         return amount * self.fetch_rate(base, target)
 
 # --------------------- Finance Service ---------------------
+# Dashboard SQL hoisted to module level so the same interned strings hit
+# sqlite3's statement cache on every refresh.
+SQL_LIST_ACCOUNTS = "SELECT * FROM accounts ORDER BY created_at DESC"
+SQL_LIST_EXPENSES = "SELECT * FROM expenses ORDER BY date DESC, created_at DESC"
+SQL_LIST_INCOMES = "SELECT * FROM incomes ORDER BY expected_date DESC, created_at DESC"
+SQL_TOTALS = "SELECT type, currency, SUM(balance) AS s FROM accounts GROUP BY type, currency"
+SQL_UPCOMING_EXP = "SELECT currency, SUM(amount) AS s FROM expenses WHERE is_upcoming=1 GROUP BY currency"
+SQL_UPCOMING_INC = "SELECT currency, SUM(amount) AS s FROM incomes WHERE is_upcoming=1 GROUP BY currency"
+SQL_PERIOD_EXP = "SELECT currency, SUM(amount) AS s FROM expenses WHERE date>=? GROUP BY currency"
+SQL_PERIOD_INC = "SELECT currency, SUM(amount) AS s FROM incomes WHERE expected_date>=? GROUP BY currency"
+SQL_SUMMARIES_EXP = """SELECT currency,
+    SUM(CASE WHEN date>=? THEN amount ELSE 0 END) AS d,
+    SUM(CASE WHEN date>=? THEN amount ELSE 0 END) AS w,
+    SUM(CASE WHEN date>=? THEN amount ELSE 0 END) AS m
+    FROM expenses GROUP BY currency"""
+SQL_SUMMARIES_INC = """SELECT currency,
+    SUM(CASE WHEN expected_date>=? THEN amount ELSE 0 END) AS d,
+    SUM(CASE WHEN expected_date>=? THEN amount ELSE 0 END) AS w,
+    SUM(CASE WHEN expected_date>=? THEN amount ELSE 0 END) AS m
+    FROM incomes GROUP BY currency"""
+
 class FinanceService:
     def __init__(self, db: DB, fx: CurrencyService):
         self.db = db
@@ -166,14 +323,23 @@ class FinanceService:
             raise ValueError("Unsupported currency")
         if acc_type not in ACCOUNT_TYPES:
             raise ValueError("Unsupported account type")
-        now = datetime.utcnow().isoformat()
+        now = _now_iso()
         return self.db.execute(
             "INSERT INTO accounts(name,currency,balance,type,created_at) VALUES(?,?,?,?,?)",
             (name, currency, balance, acc_type, now)
         )
 
     def list_accounts(self) -> List[sqlite3.Row]:
-        return self.db.query("SELECT * FROM accounts ORDER BY created_at DESC")
+        return self.db.fetchall(SQL_LIST_ACCOUNTS)
+
+    def find_target_account(self, currency: str) -> Optional[sqlite3.Row]:
+        """Liquid account in the given currency, else the newest account."""
+        rows = self.db.fetchall(
+            "SELECT * FROM accounts WHERE type='liquid' AND currency=? "
+            "ORDER BY created_at DESC LIMIT 1", (currency,))
+        if not rows:
+            rows = self.db.fetchall("SELECT * FROM accounts ORDER BY created_at DESC LIMIT 1")
+        return rows[0] if rows else None
 
     def update_balance(self, account_id: int, new_balance: float):
         self.db.execute("UPDATE accounts SET balance=? WHERE id=?", (new_balance, account_id))
@@ -188,7 +354,7 @@ class FinanceService:
 
     def add_expense(self, name: str, amount: float, currency: str, account_id: int,
                     category_id: Optional[int], is_upcoming: bool, when: date):
-        now = datetime.utcnow().isoformat()
+        now = _now_iso()
         self.db.execute("""INSERT INTO expenses
             (name, amount, currency, account_id, category_id, is_upcoming, date, created_at)
             VALUES(?,?,?,?,?,?,?,?)""",
@@ -202,12 +368,42 @@ class FinanceService:
                 debit = self.fx.convert(amount, currency, acc_cur) if currency != acc_cur else amount
                 self.update_balance(account_id, acc[0]["balance"] - debit)
 
+    def add_expenses_many(self, rows: List[tuple]):
+        """Bulk-insert expenses in one transaction.
+
+        rows: (name, amount, currency, account_id, category_id, is_upcoming, when) tuples.
+        Balance deltas are aggregated per account and applied with one UPDATE each.
+        """
+        now = _now_iso()
+        params = []
+        deltas: Dict[int, float] = {}
+        acc_cur = {a["id"]: a["currency"] for a in self.list_accounts()}
+        for name, amount, currency, account_id, category_id, is_upcoming, when in rows:
+            params.append((name, amount, currency, account_id, category_id,
+                           1 if is_upcoming else 0, when.isoformat(), now))
+            if not is_upcoming and account_id in acc_cur:
+                cur = acc_cur[account_id]
+                debit = self.fx.convert(amount, currency, cur) if currency != cur else amount
+                deltas[account_id] = deltas.get(account_id, 0.0) + debit
+        c = self.db.conn.cursor()
+        c.execute("BEGIN")
+        try:
+            c.executemany("""INSERT INTO expenses
+                (name, amount, currency, account_id, category_id, is_upcoming, date, created_at)
+                VALUES(?,?,?,?,?,?,?,?)""", params)
+            c.executemany("UPDATE accounts SET balance = balance - ? WHERE id=?",
+                          [(d, acc_id) for acc_id, d in deltas.items()])
+            c.execute("COMMIT")
+        except Exception:
+            c.execute("ROLLBACK")
+            raise
+
     def list_expenses(self) -> List[sqlite3.Row]:
-        return self.db.query("SELECT * FROM expenses ORDER BY date DESC, created_at DESC")
+        return self.db.fetchall(SQL_LIST_EXPENSES)
 
     def add_income(self, source: str, description: str, amount: float, currency: str,
                    is_upcoming: bool, expected_date: date):
-        now = datetime.utcnow().isoformat()
+        now = _now_iso()
         self.db.execute("""INSERT INTO incomes
             (source, description, amount, currency, is_upcoming, expected_date, created_at)
             VALUES(?,?,?,?,?,?,?)""",
@@ -215,7 +411,27 @@ class FinanceService:
              expected_date.isoformat(), now)
         )
         if not is_upcoming:
-            accounts = self.list_accounts()
+            target_acc = self.find_target_account(currency)
+            if target_acc:
+                acc_cur = target_acc["currency"]
+                credit = self.fx.convert(amount, currency, acc_cur) if currency != acc_cur else amount
+                self.update_balance(target_acc["id"], target_acc["balance"] + credit)
+
+    def add_incomes_many(self, rows: List[tuple]):
+        """Bulk-insert incomes in one transaction.
+
+        rows: (source, description, amount, currency, is_upcoming, expected_date) tuples.
+        Credits are aggregated per target account and applied with one UPDATE each.
+        """
+        now = _now_iso()
+        accounts = self.list_accounts()
+        params = []
+        deltas: Dict[int, float] = {}
+        for source, description, amount, currency, is_upcoming, expected_date in rows:
+            params.append((source, description, amount, currency,
+                           1 if is_upcoming else 0, expected_date.isoformat(), now))
+            if is_upcoming:
+                continue
             target_acc = None
             for a in accounts:
                 if a["type"] == "liquid" and a["currency"] == currency:
@@ -226,19 +442,32 @@ class FinanceService:
             if target_acc:
                 acc_cur = target_acc["currency"]
                 credit = self.fx.convert(amount, currency, acc_cur) if currency != acc_cur else amount
-                self.update_balance(target_acc["id"], target_acc["balance"] + credit)
+                deltas[target_acc["id"]] = deltas.get(target_acc["id"], 0.0) + credit
+        c = self.db.conn.cursor()
+        c.execute("BEGIN")
+        try:
+            c.executemany("""INSERT INTO incomes
+                (source, description, amount, currency, is_upcoming, expected_date, created_at)
+                VALUES(?,?,?,?,?,?,?)""", params)
+            c.executemany("UPDATE accounts SET balance = balance + ? WHERE id=?",
+                          [(d, acc_id) for acc_id, d in deltas.items()])
+            c.execute("COMMIT")
+        except Exception:
+            c.execute("ROLLBACK")
+            raise
 
     def list_incomes(self) -> List[sqlite3.Row]:
-        return self.db.query("SELECT * FROM incomes ORDER BY expected_date DESC, created_at DESC")
+        return self.db.fetchall(SQL_LIST_INCOMES)
 
     def totals(self) -> Dict[str, float]:
         display_cur = self.fx.get_display_currency()
-        accounts = self.list_accounts()
+        # Aggregate in SQL so conversions run per currency bucket, not per row
+        buckets = self.db.query_tuples(SQL_TOTALS)
         total_fixed = 0.0
         total_liquid = 0.0
-        for a in accounts:
-            amt = a["balance"] if a["currency"] == display_cur else self.fx.convert(a["balance"], a["currency"], display_cur)
-            if a["type"] == "fixed":
+        for acc_type, currency, s in buckets:
+            amt = s if currency == display_cur else self.fx.convert(s, currency, display_cur)
+            if acc_type == "fixed":
                 total_fixed += amt
             else:
                 total_liquid += amt
@@ -251,10 +480,13 @@ class FinanceService:
 
     def upcoming_totals(self) -> Dict[str, float]:
         display_cur = self.fx.get_display_currency()
-        exp = self.db.query("SELECT amount, currency FROM expenses WHERE is_upcoming=1")
-        inc = self.db.query("SELECT amount, currency FROM incomes WHERE is_upcoming=1")
-        up_exp = sum(self.fx.convert(e["amount"], e["currency"], display_cur) for e in exp)
-        up_inc = sum(self.fx.convert(i["amount"], i["currency"], display_cur) for i in inc)
+        exp = self.db.query_tuples(SQL_UPCOMING_EXP)
+        inc = self.db.query_tuples(SQL_UPCOMING_INC)
+        convert = self.fx.convert
+        up_exp = sum(s if currency == display_cur else convert(s, currency, display_cur)
+                     for currency, s in exp)
+        up_inc = sum(s if currency == display_cur else convert(s, currency, display_cur)
+                     for currency, s in inc)
         return {
             "display_currency": display_cur,
             "upcoming_expenses": round(up_exp, 2),
@@ -274,10 +506,13 @@ class FinanceService:
         else:
             raise ValueError("period must be daily/weekly/monthly")
 
-        exp = self.db.query("SELECT amount, currency FROM expenses WHERE date>=?", (start.isoformat(),))
-        inc = self.db.query("SELECT amount, currency FROM incomes WHERE expected_date>=?", (start.isoformat(),))
-        total_exp = sum(self.fx.convert(e["amount"], e["currency"], display_cur) for e in exp)
-        total_inc = sum(self.fx.convert(i["amount"], i["currency"], display_cur) for i in inc)
+        exp = self.db.query_tuples(SQL_PERIOD_EXP, (start.isoformat(),))
+        inc = self.db.query_tuples(SQL_PERIOD_INC, (start.isoformat(),))
+        convert = self.fx.convert
+        total_exp = sum(s if currency == display_cur else convert(s, currency, display_cur)
+                        for currency, s in exp)
+        total_inc = sum(s if currency == display_cur else convert(s, currency, display_cur)
+                        for currency, s in inc)
         return {
             "display_currency": display_cur,
             "period": period,
@@ -286,10 +521,72 @@ class FinanceService:
             "net": round(total_inc - total_exp, 2)
         }
 
+    def period_summaries_all(self) -> Dict[str, Dict[str, float]]:
+        """Daily/weekly/monthly summaries in one query per table via conditional aggregation."""
+        display_cur = self.fx.get_display_currency()
+        today = date.today()
+        starts = (
+            today.isoformat(),
+            date.fromisocalendar(today.isocalendar()[0], today.isocalendar()[1], 1).isoformat(),
+            date(today.year, today.month, 1).isoformat(),
+        )
+        exp = self.db.query_tuples(SQL_SUMMARIES_EXP, starts)
+        inc = self.db.query_tuples(SQL_SUMMARIES_INC, starts)
+        out = {}
+        convert = self.fx.convert
+        # rows are (currency, daily, weekly, monthly)
+        for period, col in (("daily", 1), ("weekly", 2), ("monthly", 3)):
+            total_exp = sum(e[col] if e[0] == display_cur else convert(e[col], e[0], display_cur)
+                            for e in exp)
+            total_inc = sum(i[col] if i[0] == display_cur else convert(i[col], i[0], display_cur)
+                            for i in inc)
+            out[period] = {
+                "display_currency": display_cur,
+                "period": period,
+                "expenses": round(total_exp, 2),
+                "income": round(total_inc, 2),
+                "net": round(total_inc - total_exp, 2)
+            }
+        return out
+
+    def dashboard_snapshot(self) -> Dict[str, Dict]:
+        """All dashboard aggregates under one read transaction.
+
+        Keeps the shared lock and warm page cache across the statements instead
+        of acquiring/releasing per query.
+        """
+        c = self.db.conn.cursor()
+        c.execute("BEGIN")
+        try:
+            snap = {
+                "totals": self.totals(),
+                "upcoming": self.upcoming_totals(),
+            }
+            snap.update(self.period_summaries_all())
+            c.execute("COMMIT")
+        except Exception:
+            c.execute("ROLLBACK")
+            raise
+        return snap
+
 # --------------------- UI helpers ---------------------
 from PySide6.QtWidgets import QFrame, QVBoxLayout, QLabel, QGraphicsDropShadowEffect
 from PySide6.QtGui import QFont, QColor
 
+# Shared card fonts/styles so every card() call reuses one QFont instance and
+# one interned stylesheet string. QFont needs a live QApplication (and the
+# Inter font registered), so the fonts are created lazily via _ensure_fonts().
+CARD_TITLE_FONT: Optional[QFont] = None
+CARD_VALUE_FONT: Optional[QFont] = None
+CARD_TITLE_STYLE = "color: #cfd2ff;"
+CARD_VALUE_STYLE = "color: white;"
+
+def _ensure_fonts():
+    global CARD_TITLE_FONT, CARD_VALUE_FONT
+    if CARD_TITLE_FONT is None:
+        CARD_TITLE_FONT = QFont("Inter", 11, QFont.Bold)
+        CARD_VALUE_FONT = QFont("Inter", 22, QFont.Bold)
+
 def card(title: str, value: str, accent_class: str) -> QFrame:
     """
     Create a styled dashboard card with title + value.
@@ -308,19 +605,25 @@ def card(title: str, value: str, accent_class: str) -> QFrame:
     layout.setContentsMargins(16, 12, 16, 12)
     layout.setSpacing(6)
 
+    _ensure_fonts()
+
     # Title label
     title_lbl = QLabel(title)
-    title_lbl.setStyleSheet("color: #cfd2ff;")
-    title_lbl.setFont(QFont("Inter", 11, QFont.Bold))
+    title_lbl.setStyleSheet(CARD_TITLE_STYLE)
+    title_lbl.setFont(CARD_TITLE_FONT)
 
     # Value label
     value_lbl = QLabel(value)
-    value_lbl.setFont(QFont("Inter", 22, QFont.Bold))
-    value_lbl.setStyleSheet("color: white;")
+    value_lbl.setFont(CARD_VALUE_FONT)
+    value_lbl.setStyleSheet(CARD_VALUE_STYLE)
 
     layout.addWidget(title_lbl)
     layout.addWidget(value_lbl)
 
+    # Expose the labels so callers can update text without rebuilding the card
+    f.title_lbl = title_lbl
+    f.value_lbl = value_lbl
+
     # Drop shadow effect
     shadow = QGraphicsDropShadowEffect()
     shadow.setBlurRadius(24)
@@ -341,16 +644,66 @@ class ChartWidget(QWidget):
         self.title_lbl.setStyleSheet("color:#aeb3ff; font-weight:bold;")
         v.addWidget(self.title_lbl)
         v.addWidget(self.canvas)
+        # Build axes and line artists once; plot_cashflow only updates their data
+        self.ax = self.fig.add_subplot(111)
+        self.line_inc, = self.ax.plot([], [], label="Income", color="#4CAF50")
+        self.line_exp, = self.ax.plot([], [], label="Expenses", color="#F44336")
+        self.ax.grid(alpha=0.2)
+        self.ax.legend()
+        self._fill = None
 
     def plot_cashflow(self, days, incomes, expenses):
-        self.fig.clear()                       # just clear
-        ax = self.fig.add_subplot(111)         # then add subplot
-        ax.plot(days, incomes, label="Income", color="#4CAF50")
-        ax.plot(days, expenses, label="Expenses", color="#F44336")
-        ax.fill_between(days, incomes, expenses, color="#2196F3", alpha=0.15)
-        ax.grid(alpha=0.2)
-        ax.legend()
-        self.canvas.draw()
+        xs = range(len(days))
+        self.line_inc.set_data(xs, incomes)
+        self.line_exp.set_data(xs, expenses)
+        # fill_between has no in-place update; drop and re-add the collection
+        if self._fill is not None:
+            self._fill.remove()
+        self._fill = self.ax.fill_between(xs, incomes, expenses, color="#2196F3", alpha=0.15)
+        self.ax.set_xticks(list(xs))
+        self.ax.set_xticklabels(days)
+        self.ax.relim()
+        self.ax.autoscale_view()
+        self.canvas.draw_idle()
+
+
+class TxTableModel(QAbstractTableModel):
+    """Read-only model over preformatted display rows.
+
+    QTableView only asks data() for visible cells, so painting cost stays
+    O(visible rows) instead of materializing a QTableWidgetItem per cell.
+    """
+    def __init__(self, headers: List[str], parent=None):
+        super().__init__(parent)
+        self._headers = headers
+        self._rows: List[tuple] = []
+
+    def rowCount(self, parent=QModelIndex()):
+        return 0 if parent.isValid() else len(self._rows)
+
+    def columnCount(self, parent=QModelIndex()):
+        return 0 if parent.isValid() else len(self._headers)
+
+    def data(self, index, role=Qt.DisplayRole):
+        if role == Qt.DisplayRole and index.isValid():
+            val = self._rows[index.row()][index.column()]
+            return val if isinstance(val, str) else str(val)
+        return None
+
+    def headerData(self, section, orientation, role=Qt.DisplayRole):
+        if role == Qt.DisplayRole and orientation == Qt.Horizontal:
+            return self._headers[section]
+        return None
+
+    def set_rows(self, rows: List[tuple]):
+        self.beginResetModel()
+        self._rows = rows
+        self.endResetModel()
+
+    def prepend(self, row: tuple):
+        self.beginInsertRows(QModelIndex(), 0, 0)
+        self._rows.insert(0, row)
+        self.endInsertRows()
 
 
 # --------------------- Pages ---------------------
@@ -362,8 +715,9 @@ class AccountsPage(QWidget):
         header = QLabel("Accounts")
         header.setStyleSheet("color:#aeb3ff; font-weight:bold; font-size:14pt;")
         self.layout().addWidget(header)
-        self.table = QTableWidget(0, 5)
-        self.table.setHorizontalHeaderLabels(["Name", "Currency", "Balance", "Type", "Created"])
+        self.model = TxTableModel(["Name", "Currency", "Balance", "Type", "Created"])
+        self.table = QTableView()
+        self.table.setModel(self.model)
         self.layout().addWidget(self.table)
         self.layout().addWidget(self._form_group())
         self.refresh()
@@ -402,10 +756,11 @@ class AccountsPage(QWidget):
 
     def refresh(self):
         rows = self.finance.list_accounts()
-        self.table.setRowCount(len(rows))
-        for i, r in enumerate(rows):
-            for j, val in enumerate([r["name"], r["currency"], f'{r["balance"]:.2f}', r["type"], r["created_at"]]):
-                self.table.setItem(i, j, QTableWidgetItem(str(val)))
+        _fmt = "{:.2f}".format
+        self.model.set_rows([
+            (r["name"], r["currency"], _fmt(r["balance"]), r["type"], r["created_at"])
+            for r in rows
+        ])
 
 class ExpensesPage(QWidget):
     def __init__(self, finance: FinanceService):
@@ -415,8 +770,9 @@ class ExpensesPage(QWidget):
         header = QLabel("Expenses")
         header.setStyleSheet("color:#aeb3ff; font-weight:bold; font-size:14pt;")
         self.layout().addWidget(header)
-        self.table = QTableWidget(0, 7)
-        self.table.setHorizontalHeaderLabels(["Name","Amount","Currency","From Account","Category","Upcoming","Date"])
+        self.model = TxTableModel(["Name","Amount","Currency","From Account","Category","Upcoming","Date"])
+        self.table = QTableView()
+        self.table.setModel(self.model)
         self.layout().addWidget(self.table)
         self.layout().addWidget(self._form_group())
         self.refresh()
@@ -459,16 +815,18 @@ class ExpensesPage(QWidget):
     def _add(self):
         try:
             when = self.date_in.date().toPython()
-            self.finance.add_expense(
-                self.name_in.text().strip(),
-                float(self.amount_in.value()),
-                self.currency_in.currentText(),
-                self.account_in.currentData(),
-                self.category_in.currentData(),
-                self.upcoming_in.isChecked(),
-                when
-            )
-            self.refresh()
+            name = self.name_in.text().strip()
+            amount = float(self.amount_in.value())
+            currency = self.currency_in.currentText()
+            account_id = self.account_in.currentData()
+            category_id = self.category_in.currentData()
+            upcoming = self.upcoming_in.isChecked()
+            self.finance.add_expense(name, amount, currency, account_id,
+                                     category_id, upcoming, when)
+            # Prepend the single new row instead of rebuilding the whole table
+            self.model.prepend((name, f'{amount:.2f}', currency, account_id,
+                                category_id if category_id else "-",
+                                "Yes" if upcoming else "No", when.isoformat()))
             QMessageBox.information(self, "Success", "Expense added.")
             self.name_in.clear(); self.amount_in.setValue(0.0)
         except Exception as e:
@@ -476,12 +834,13 @@ class ExpensesPage(QWidget):
 
     def refresh(self):
         rows = self.finance.list_expenses()
-        self.table.setRowCount(len(rows))
-        for i, r in enumerate(rows):
-            display = [r["name"], f'{r["amount"]:.2f}', r["currency"], r["account_id"],
-                       r["category_id"] if r["category_id"] else "-", "Yes" if r["is_upcoming"] else "No", r["date"]]
-            for j, val in enumerate(display):
-                self.table.setItem(i, j, QTableWidgetItem(str(val)))
+        _fmt = "{:.2f}".format
+        self.model.set_rows([
+            (r["name"], _fmt(r["amount"]), r["currency"], r["account_id"],
+             r["category_id"] if r["category_id"] else "-",
+             "Yes" if r["is_upcoming"] else "No", r["date"])
+            for r in rows
+        ])
 
 class IncomePage(QWidget):
     def __init__(self, finance: FinanceService):
@@ -491,8 +850,9 @@ class IncomePage(QWidget):
         header = QLabel("Income")
         header.setStyleSheet("color:#aeb3ff; font-weight:bold; font-size:14pt;")
         self.layout().addWidget(header)
-        self.table = QTableWidget(0, 6)
-        self.table.setHorizontalHeaderLabels(["Source","Description","Amount","Currency","Upcoming","Expected date"])
+        self.model = TxTableModel(["Source","Description","Amount","Currency","Upcoming","Expected date"])
+        self.table = QTableView()
+        self.table.setModel(self.model)
         self.layout().addWidget(self.table)
         self.layout().addWidget(self._form_group())
         self.refresh()
@@ -522,15 +882,15 @@ class IncomePage(QWidget):
     def _add(self):
         try:
             when = self.date_in.date().toPython()
-            self.finance.add_income(
-                self.source_in.text().strip(),
-                self.desc_in.text().strip(),
-                float(self.amount_in.value()),
-                self.currency_in.currentText(),
-                self.upcoming_in.isChecked(),
-                when
-            )
-            self.refresh()
+            source = self.source_in.text().strip()
+            desc = self.desc_in.text().strip()
+            amount = float(self.amount_in.value())
+            currency = self.currency_in.currentText()
+            upcoming = self.upcoming_in.isChecked()
+            self.finance.add_income(source, desc, amount, currency, upcoming, when)
+            # Prepend the single new row instead of rebuilding the whole table
+            self.model.prepend((source, desc or "-", f'{amount:.2f}', currency,
+                                "Yes" if upcoming else "No", when.isoformat()))
             QMessageBox.information(self, "Success", "Income added.")
             self.source_in.clear(); self.desc_in.clear(); self.amount_in.setValue(0.0)
         except Exception as e:
@@ -538,12 +898,12 @@ class IncomePage(QWidget):
 
     def refresh(self):
         rows = self.finance.list_incomes()
-        self.table.setRowCount(len(rows))
-        for i, r in enumerate(rows):
-            display = [r["source"], r["description"] or "-", f'{r["amount"]:.2f}', r["currency"],
-                       "Yes" if r["is_upcoming"] else "No", r["expected_date"]]
-            for j, val in enumerate(display):
-                self.table.setItem(i, j, QTableWidgetItem(str(val)))
+        _fmt = "{:.2f}".format
+        self.model.set_rows([
+            (r["source"], r["description"] or "-", _fmt(r["amount"]), r["currency"],
+             "Yes" if r["is_upcoming"] else "No", r["expected_date"])
+            for r in rows
+        ])
 
 class HomePage(QWidget):
     def __init__(self, finance: FinanceService):
@@ -575,6 +935,22 @@ class HomePage(QWidget):
         self.fab.clicked.connect(self._fab_action)
         self.layout().addWidget(self.fab, alignment=Qt.AlignRight)
 
+        # Cards are built once; refresh() only updates their labels
+        self.cards = {
+            "total": card("Total", "0.00", "card-blue"),
+            "up_inc": card("Upcoming incomes", "0.00", "card-green"),
+            "up_exp": card("Upcoming expenses", "0.00", "card-red"),
+            "projected": card("Projected total", "0.00", "card-gold"),
+        }
+        self._last_cards = list(self.cards.values())
+        self._last_per_row = None
+
+        # Resize only re-lays out the cards, debounced so a drag-resize doesn't
+        # trigger a relayout per pixel tick; data refresh stays explicit.
+        self._resize_timer = QTimer(self)
+        self._resize_timer.setSingleShot(True)
+        self._resize_timer.timeout.connect(self._relayout_cards)
+
         self.refresh()
         self._animate_cards()
 
@@ -594,39 +970,15 @@ class HomePage(QWidget):
             
     def resizeEvent(self, event):
         super().resizeEvent(event)
-        self.refresh()   # re‑arrange cards when window size changes
+        self._resize_timer.start(150)
 
 
     def _fab_action(self):
         QMessageBox.information(self, "Quick Add", "Use the Expenses or Income tab to add transactions.")
 
-    def refresh(self):
-        totals = self.finance.totals()
-        upcoming = self.finance.upcoming_totals()
-        daily = self.finance.period_summary("daily")
-        weekly = self.finance.period_summary("weekly")
-        monthly = self.finance.period_summary("monthly")
-
-        # --- Build cards ---
-        c1 = card(f"Total ({totals['display_currency']})",
-                  f"{totals['total_all']:.2f}", "card-blue")
-        c2 = card("Upcoming incomes",
-                  f"{upcoming['upcoming_incomes']:.2f}", "card-green")
-        c3 = card("Upcoming expenses",
-                  f"{upcoming['upcoming_expenses']:.2f}", "card-red")
-        c4 = card("Projected total",
-                  f"{upcoming['projected_total']:.2f}", "card-gold")
-
-        cards = [c1, c2, c3, c4]
-
-        # --- Clear old cards from the grid ---
-        while self.cards_grid.count():
-            item = self.cards_grid.takeAt(0)
-            w = item.widget()
-            if w:
-                w.setParent(None)
-
-        # --- Decide how many per row based on window width ---
+    def _relayout_cards(self):
+        """Re-arrange the cached card widgets; pure geometry, no DB access."""
+        # Decide how many per row based on window width
         width = self.width()
         if width > 1000:
             per_row = 4   # all in one row
@@ -635,16 +987,37 @@ class HomePage(QWidget):
         else:
             per_row = 1   # stacked vertically
 
-        # --- Add cards accordingly ---
+        if per_row == self._last_per_row:
+            return
+        self._last_per_row = per_row
+
+        while self.cards_grid.count():
+            self.cards_grid.takeAt(0)
+
         row, col = 0, 0
-        for card_widget in cards:
+        for card_widget in self._last_cards:
             self.cards_grid.addWidget(card_widget, row, col, alignment=Qt.AlignTop)
             col += 1
             if col >= per_row:
                 col = 0
                 row += 1
 
-        # --- Cashflow chart (synthetic from period summaries) ---
+    def refresh(self):
+        snap = self.finance.dashboard_snapshot()
+        totals = snap["totals"]
+        upcoming = snap["upcoming"]
+        daily = snap["daily"]
+        weekly = snap["weekly"]
+        monthly = snap["monthly"]
+
+        # --- Update cached cards in place ---
+        self.cards["total"].title_lbl.setText(f"Total ({totals['display_currency']})")
+        self.cards["total"].value_lbl.setText(f"{totals['total_all']:.2f}")
+        self.cards["up_inc"].value_lbl.setText(f"{upcoming['upcoming_incomes']:.2f}")
+        self.cards["up_exp"].value_lbl.setText(f"{upcoming['upcoming_expenses']:.2f}")
+        self.cards["projected"].value_lbl.setText(f"{upcoming['projected_total']:.2f}")
+        self._relayout_cards()
+
         # --- Cashflow chart (synthetic from period summaries) ---
         days = ["D", "W", "M"]
         incomes = [daily["income"], weekly["income"], monthly["income"]]
@@ -715,6 +1088,7 @@ class MainWindow(QMainWindow):
         font_path = os.path.join(ASSETS_DIR, "fonts", "Inter-Regular.ttf")
         if os.path.exists(font_path):
             QFontDatabase.addApplicationFont(font_path)
+        _ensure_fonts()
 
         # Icons (optional)
         self.setWindowIcon(QIcon(os.path.join(ICON_DIR, "wallet.svg")) if os.path.exists(ICON_DIR) else QIcon())
@@ -736,8 +1110,12 @@ class MainWindow(QMainWindow):
         self.tabs.addTab(self.expenses, "Expenses")
         self.tabs.addTab(self.income, "Income")
         self.tabs.addTab(self.settings, "Settings")
+        self.fx.rate_updated.connect(self._on_rate_updated)
         self._menu()
 
+    def _on_rate_updated(self, base, target, rate):
+        self.home.refresh()
+
     def _menu(self):
         bar = self.menuBar()
         file_menu = bar.addMenu("File")
@@ -751,13 +1129,21 @@ class MainWindow(QMainWindow):
         self.expenses.refresh()
         self.income.refresh()
 
+    def closeEvent(self, event):
+        self.fx.close()
+        super().closeEvent(event)
+
+@lru_cache(maxsize=1)
+def _load_qss(path: str) -> str:
+    # raw byte read + one decode; cached so re-applying the theme is free
+    return Path(path).read_bytes().decode("utf-8")
+
 def main():
     app = QApplication(sys.argv)
     # Apply QSS theme
     theme_path = os.path.join(ASSETS_DIR, "theme.qss")
     if os.path.exists(theme_path):
-        with open(theme_path, "r", encoding="utf-8") as f:
-            app.setStyleSheet(f.read())
+        app.setStyleSheet(_load_qss(theme_path))
 
     w = MainWindow()
     w.show()
@@ -1,8 +1,11 @@
-import os, sys, sqlite3, csv, requests
-from datetime import datetime, date
+import os, sys, sqlite3, csv, json
+from collections import namedtuple
+from contextlib import contextmanager
+from datetime import datetime, date, timedelta, timezone
+from functools import lru_cache
 from PySide6.QtCore import Qt, QDate
 from PySide6.QtGui import QFont, QColor
-from PySide6.QtCore import Qt, QDate, QPropertyAnimation, QEasingCurve, QRect
+from PySide6.QtCore import Qt, QDate, QPropertyAnimation, QEasingCurve, QRect, QTimer, QAbstractTableModel, QModelIndex, QObject, QRunnable, QThreadPool, Signal
 from PySide6.QtGui import QAction, QFontDatabase, QIcon, QColor, QFont
 from PySide6.QtWidgets import (
     QApplication, QMainWindow, QWidget, QTabWidget, QVBoxLayout, QHBoxLayout,
@@ -11,112 +14,366 @@ from PySide6.QtWidgets import (
     QGroupBox, QFrame, QGridLayout, QGraphicsDropShadowEffect
 )
 
+# requests and matplotlib are imported lazily (CurrencyService / ChartWidget):
+# together they add several hundred ms of cold startup the first paint shouldn't pay
 
-from matplotlib.backends.backend_qtagg import FigureCanvasQTAgg as FigureCanvas
-from matplotlib.figure import Figure
+# own DB file: this draft stores integer cents and must never run its one-shot
+# cents migration against main.py's unit-denominated ~/.finx.db
+DB_PATH = os.path.join(os.path.expanduser("~"), ".finx_v1.db")
+_UTC = timezone.utc  # cached; datetime.utcnow is deprecated in 3.12+
+
+def now_iso(): return datetime.now(_UTC).isoformat()
 
-DB_PATH = os.path.join(os.path.expanduser("~"), ".finx.db")
 SUPPORTED_CURRENCIES = ["BDT", "USD"]
 ACCOUNT_TYPES = ["fixed", "liquid"]
 
+# amounts/balances are stored as INTEGER cents (BDT paisa / USD cents): exact
+# arithmetic, and integers pack tighter in SQLite records than 8-byte REALs
+def _to_cents(x): return round(x * 100)
+def _from_cents(n): return n / 100
+
 # ---------------- DB ----------------
+@lru_cache(maxsize=32)
+def _row_type(fields):
+    # one lightweight row class per distinct column shape, built once and reused
+    return namedtuple("HotRow", fields)
+
 class DB:
     def __init__(self, path=DB_PATH):
-        self.conn = sqlite3.connect(path)
+        # autocommit off; WAL + NORMAL cut the per-commit fsync, mmap skips read() copies
+        self.conn = sqlite3.connect(path, isolation_level=None)
         self.conn.row_factory = sqlite3.Row
+        self.conn.execute("PRAGMA journal_mode=WAL")
+        self.conn.execute("PRAGMA synchronous=NORMAL")
+        self.conn.execute("PRAGMA temp_store=MEMORY")
+        self.conn.execute("PRAGMA mmap_size=268435456")
+        self.conn.execute("PRAGMA cache_size=-20000")
+        self.conn.execute("PRAGMA foreign_keys=ON")
         self.init_schema()
 
     def init_schema(self):
         c = self.conn.cursor()
+        c.execute("BEGIN")
         c.execute("""CREATE TABLE IF NOT EXISTS accounts(
             id INTEGER PRIMARY KEY AUTOINCREMENT,
-            name TEXT, currency TEXT, balance REAL, type TEXT, created_at TEXT)""")
+            name TEXT, currency TEXT, balance INTEGER, type TEXT, created_at TEXT)""")
         c.execute("""CREATE TABLE IF NOT EXISTS categories(
             id INTEGER PRIMARY KEY AUTOINCREMENT,
             name TEXT, kind TEXT, is_default INTEGER)""")
         c.execute("""CREATE TABLE IF NOT EXISTS expenses(
             id INTEGER PRIMARY KEY AUTOINCREMENT,
-            name TEXT, amount REAL, currency TEXT, account_id INTEGER,
+            name TEXT, amount INTEGER, currency TEXT, account_id INTEGER,
             category_id INTEGER, is_upcoming INTEGER, date TEXT, created_at TEXT)""")
         c.execute("""CREATE TABLE IF NOT EXISTS incomes(
             id INTEGER PRIMARY KEY AUTOINCREMENT,
-            source TEXT, description TEXT, amount REAL, currency TEXT,
+            source TEXT, description TEXT, amount INTEGER, currency TEXT,
             account_id INTEGER, is_upcoming INTEGER, expected_date TEXT, created_at TEXT)""")
         c.execute("""CREATE TABLE IF NOT EXISTS transfers(
             id INTEGER PRIMARY KEY AUTOINCREMENT,
-            from_account INTEGER, to_account INTEGER, amount REAL, currency TEXT, date TEXT)""")
+            from_account INTEGER, to_account INTEGER, amount INTEGER, currency TEXT, date TEXT)""")
+        # one-shot migration: user_version 0 means amounts are legacy REAL units
+        if c.execute("PRAGMA user_version").fetchone()[0] < 1:
+            for t, col in (("accounts","balance"),("expenses","amount"),
+                           ("incomes","amount"),("transfers","amount")):
+                c.execute(f"UPDATE {t} SET {col} = CAST(ROUND({col}*100) AS INTEGER)")
+            c.execute("PRAGMA user_version=1")
+        # indexes covering the ORDER BY / join columns hit on every Home refresh
+        c.execute("CREATE INDEX IF NOT EXISTS ix_expenses_date ON expenses(date DESC)")
+        c.execute("CREATE INDEX IF NOT EXISTS ix_incomes_expected ON incomes(expected_date DESC)")
+        c.execute("CREATE INDEX IF NOT EXISTS ix_expenses_acct ON expenses(account_id)")
+        c.execute("CREATE INDEX IF NOT EXISTS ix_incomes_acct ON incomes(account_id)")
         self.conn.commit()
 
     def query(self, sql, params=()):
         cur = self.conn.cursor(); cur.execute(sql, params); return cur.fetchall()
-    def execute(self, sql, params=()):
-        cur = self.conn.cursor(); cur.execute(sql, params); self.conn.commit(); return cur.lastrowid
+    def query_hot(self, sql, params=()):
+        # Connection.execute hits sqlite3's internal statement cache (no re-parse,
+        # no fresh cursor); rows come back as cached namedtuples whose attribute
+        # access skips sqlite3.Row's per-lookup column-name scan
+        cur = self.conn.execute(sql, params)
+        make = _row_type(tuple(d[0] for d in cur.description))._make
+        return [make(r) for r in cur.fetchall()]
+    def execute(self, sql, params=(), many=False):
+        cur = self.conn.cursor()
+        if many:
+            # explicit transaction keeps executemany to a single commit in autocommit mode
+            cur.execute("BEGIN")
+            try:
+                cur.executemany(sql, params); cur.execute("COMMIT")
+            except Exception:
+                cur.execute("ROLLBACK")
+                raise
+        else:
+            cur.execute(sql, params)
+        return cur.lastrowid
+    @contextmanager
+    def transaction(self):
+        # BEGIN IMMEDIATE grabs the write lock up front; the whole block is one
+        # atomic commit (one fsync) instead of one per statement in autocommit mode
+        cur = self.conn.cursor()
+        cur.execute("BEGIN IMMEDIATE")
+        try:
+            yield cur
+            cur.execute("COMMIT")
+        except Exception:
+            cur.execute("ROLLBACK")
+            raise
 
 # ---------------- Currency ----------------
+FX_CACHE_PATH = os.path.join(os.path.expanduser("~"), ".finx_fx.json")
+FX_TTL = timedelta(hours=24)
+
 class CurrencyService:
-    def __init__(self): self.cache = {}
+    def __init__(self): self.cache = {}; self._session = None; self._load_disk_cache()
+    def _get_session(self):
+        # one Session reuses the TCP+TLS connection across refreshes (requests.get
+        # builds and tears down a throwaway session, handshake and all, per call);
+        # built on first use so importing requests stays off the startup path
+        if self._session is None:
+            import requests
+            self._session = requests.Session()
+            self._session.mount("https://", requests.adapters.HTTPAdapter(
+                pool_connections=1, pool_maxsize=2,
+                max_retries=requests.adapters.Retry(total=2, backoff_factor=0.1)))
+        return self._session
+    def _load_disk_cache(self):
+        # cache maps (base,target) -> (rate, fetched_at); survives restarts on disk
+        try:
+            with open(FX_CACHE_PATH) as f: raw = json.load(f)
+            for k, v in raw.items():
+                base, target = k.split("/")
+                ts = datetime.fromisoformat(v["fetched_at"])
+                if ts.tzinfo is None: ts = ts.replace(tzinfo=_UTC)  # entries written pre-tz-aware
+                self.cache[(base, target)] = (v["rate"], ts)
+        except Exception: pass
+    def _save_disk_cache(self):
+        try:
+            raw = {f"{b}/{t}": {"rate": r, "fetched_at": ts.isoformat()} for (b, t), (r, ts) in self.cache.items()}
+            with open(FX_CACHE_PATH, "w") as f: json.dump(raw, f)
+        except Exception: pass
     def fetch_rate(self, base, target):
         if base == target: return 1.0
         key = (base, target)
-        if key in self.cache: return self.cache[key]
+        hit = self.cache.get(key)
+        if hit and datetime.now(_UTC) - hit[1] < FX_TTL: return hit[0]
         try:
-            r = requests.get(f"https://api.exchangerate.host/latest?base={base}&symbols={target}", timeout=3)
-            rate = r.json()["rates"][target]; self.cache[key] = rate; return rate
-        except: return 120.0 if (base, target)==("USD","BDT") else 1/120.0
+            r = self._get_session().get(f"https://api.exchangerate.host/latest?base={base}&symbols={target}", timeout=3)
+            rate = r.json()["rates"][target]
+            self.cache[key] = (rate, datetime.now(_UTC)); self._save_disk_cache()
+            return rate
+        except:
+            if hit: return hit[0]  # expired but last-known-good beats the hardcoded fallback
+            return 120.0 if (base, target)==("USD","BDT") else 1/120.0
+    def fetch_rates(self, base, targets):
+        # warm the cache for many pairs with one GET instead of one per symbol
+        now = datetime.now(_UTC)
+        need = [t for t in targets if t != base]
+        need = [t for t in need if (h := self.cache.get((base, t))) is None or now - h[1] >= FX_TTL]
+        if not need: return
+        try:
+            r = self._get_session().get(f"https://api.exchangerate.host/latest?base={base}&symbols={','.join(need)}", timeout=3)
+            for t, v in r.json()["rates"].items(): self.cache[(base, t)] = (v, datetime.now(_UTC))
+            self._save_disk_cache()
+        except Exception: pass
     def convert(self, amt, base, target): return amt*self.fetch_rate(base,target)
 
 # ---------------- Finance ----------------
+# dashboard aggregates, shared by FinanceService.dashboard_totals and
+# TotalsWorker so the two paths can't drift apart
+SQL_TOTALS_ACCOUNTS = "SELECT COUNT(*) AS n, COALESCE(SUM(balance),0) AS s FROM accounts"
+SQL_TOTALS_EXPENSES = "SELECT COUNT(*) AS n, COALESCE(SUM(CASE WHEN is_upcoming=0 THEN amount END),0) AS s FROM expenses"
+SQL_TOTALS_INCOMES  = "SELECT COUNT(*) AS n, COALESCE(SUM(CASE WHEN is_upcoming=0 THEN amount END),0) AS s FROM incomes"
+
 class FinanceService:
-    def __init__(self, db, fx): self.db, self.fx = db, fx
+    def __init__(self, db, fx): self.db, self.fx = db, fx; self._acct_cur = {}
     def add_account(self, name,currency,balance,atype):
+        self._acct_cur.clear()
         return self.db.execute("INSERT INTO accounts VALUES(NULL,?,?,?,?,?)",
-            (name,currency,balance,atype,datetime.utcnow().isoformat()))
+            (name,currency,_to_cents(balance),atype,now_iso()))
     def list_accounts(self): return self.db.query("SELECT * FROM accounts")
-    def update_balance(self, acc_id, new_bal): self.db.execute("UPDATE accounts SET balance=? WHERE id=?",(new_bal,acc_id))
+    def _get_account_currency(self, acc_id):
+        # accounts are tiny and append-only, so a dict cache is safe (cleared on add_account)
+        cur = self._acct_cur.get(acc_id)
+        if cur is None:
+            cur = self.db.query("SELECT currency FROM accounts WHERE id=?",(acc_id,))[0]["currency"]
+            self._acct_cur[acc_id] = cur
+        return cur
+    def _apply_balance_deltas(self, deltas):
+        # merge N balance updates into one CASE-WHEN UPDATE: one parse, one pass
+        if not deltas: return
+        ids = list(deltas)
+        case = " ".join(["WHEN ? THEN balance + ?"] * len(ids))
+        params = tuple(p for i in ids for p in (i, deltas[i])) + tuple(ids)
+        self.db.execute(f"UPDATE accounts SET balance = CASE id {case} END "
+                        f"WHERE id IN ({','.join('?'*len(ids))})", params)
     def add_expense(self,name,amt,currency,acc_id,cat_id,is_upcoming,when):
-        self.db.execute("INSERT INTO expenses VALUES(NULL,?,?,?,?,?,?,?,?)",
-            (name,amt,currency,acc_id,cat_id,1 if is_upcoming else 0,when.isoformat(),datetime.utcnow().isoformat()))
-        if not is_upcoming:
-            acc=self.db.query("SELECT * FROM accounts WHERE id=?",(acc_id,))[0]
-            debit=self.fx.convert(amt,currency,acc["currency"]) if currency!=acc["currency"] else amt
-            self.update_balance(acc_id, acc["balance"]-debit)
-    def list_expenses(self): return self.db.query("SELECT * FROM expenses ORDER BY date DESC")
+        cents = _to_cents(amt)
+        if is_upcoming:
+            self.db.execute("INSERT INTO expenses VALUES(NULL,?,?,?,?,?,?,?,?)",
+                (name,cents,currency,acc_id,cat_id,1,when.isoformat(),now_iso()))
+            return
+        # FX lookup (possible network hit) stays outside the write lock
+        acc_cur=self._get_account_currency(acc_id)
+        debit=round(self.fx.convert(cents,currency,acc_cur)) if currency!=acc_cur else cents
+        with self.db.transaction() as c:
+            c.execute("INSERT INTO expenses VALUES(NULL,?,?,?,?,?,?,?,?)",
+                (name,cents,currency,acc_id,cat_id,0,when.isoformat(),now_iso()))
+            # relative update: atomic, and skips the read-modify-write round-trip
+            c.execute("UPDATE accounts SET balance = balance - ? WHERE id=?",(debit,acc_id))
+    def add_expenses_bulk(self, rows):
+        # rows: (name, amt, currency, acc_id, cat_id, is_upcoming, when) tuples;
+        # one executemany + one commit amortizes parsing and fsync across the batch
+        now = now_iso()
+        params = [(n,_to_cents(a),cur,acc,cat,1 if up else 0,w.isoformat(),now) for n,a,cur,acc,cat,up,w in rows]
+        cur_by_acc = {a["id"]: a["currency"] for a in self.list_accounts()}
+        # one batched rate fetch per distinct base so the delta loop never hits the
+        # network (and no FX call ever runs while the write lock is held)
+        for b in {cur for n,a,cur,acc,cat,up,w in rows if not up}:
+            self.fx.fetch_rates(b, set(cur_by_acc.values()))
+        deltas = {}
+        for n,amt,cur,acc,cat,up,w in rows:
+            if up or acc not in cur_by_acc: continue
+            cents = _to_cents(amt)
+            d = round(self.fx.convert(cents,cur,cur_by_acc[acc])) if cur!=cur_by_acc[acc] else cents
+            deltas[acc] = deltas.get(acc,0)-d
+        # inserts and balance deltas commit together: no window where the ledger
+        # rows exist but the balances haven't moved
+        with self.db.transaction() as c:
+            c.executemany("INSERT INTO expenses VALUES(NULL,?,?,?,?,?,?,?,?)", params)
+            self._apply_balance_deltas(deltas)
+    def list_expenses(self, limit=None):
+        if limit: return self.db.query("SELECT * FROM expenses ORDER BY date DESC LIMIT ?", (limit,))
+        return self.db.query("SELECT * FROM expenses ORDER BY date DESC")
     def add_income(self,src,desc,amt,currency,acc_id,is_upcoming,when):
-        self.db.execute("INSERT INTO incomes VALUES(NULL,?,?,?,?,?,?,?,?)",
-            (src,desc,amt,currency,acc_id,1 if is_upcoming else 0,when.isoformat(),datetime.utcnow().isoformat()))
-        if not is_upcoming:
-            acc=self.db.query("SELECT * FROM accounts WHERE id=?",(acc_id,))[0]
-            credit=self.fx.convert(amt,currency,acc["currency"]) if currency!=acc["currency"] else amt
-            self.update_balance(acc_id, acc["balance"]+credit)
-    def list_incomes(self): return self.db.query("SELECT * FROM incomes ORDER BY expected_date DESC")
+        cents = _to_cents(amt)
+        if is_upcoming:
+            self.db.execute("INSERT INTO incomes VALUES(NULL,?,?,?,?,?,?,?,?)",
+                (src,desc,cents,currency,acc_id,1,when.isoformat(),now_iso()))
+            return
+        acc_cur=self._get_account_currency(acc_id)
+        credit=round(self.fx.convert(cents,currency,acc_cur)) if currency!=acc_cur else cents
+        with self.db.transaction() as c:
+            c.execute("INSERT INTO incomes VALUES(NULL,?,?,?,?,?,?,?,?)",
+                (src,desc,cents,currency,acc_id,0,when.isoformat(),now_iso()))
+            c.execute("UPDATE accounts SET balance = balance + ? WHERE id=?",(credit,acc_id))
+    def add_incomes_bulk(self, rows):
+        # rows: (src, desc, amt, currency, acc_id, is_upcoming, when) tuples
+        now = now_iso()
+        params = [(s,de,_to_cents(a),cur,acc,1 if up else 0,w.isoformat(),now) for s,de,a,cur,acc,up,w in rows]
+        cur_by_acc = {a["id"]: a["currency"] for a in self.list_accounts()}
+        for b in {cur for s,de,a,cur,acc,up,w in rows if not up}:
+            self.fx.fetch_rates(b, set(cur_by_acc.values()))
+        deltas = {}
+        for s,de,amt,cur,acc,up,w in rows:
+            if up or acc not in cur_by_acc: continue
+            cents = _to_cents(amt)
+            cr = round(self.fx.convert(cents,cur,cur_by_acc[acc])) if cur!=cur_by_acc[acc] else cents
+            deltas[acc] = deltas.get(acc,0)+cr
+        with self.db.transaction() as c:
+            c.executemany("INSERT INTO incomes VALUES(NULL,?,?,?,?,?,?,?,?)", params)
+            self._apply_balance_deltas(deltas)
+    def list_incomes(self, limit=None):
+        if limit: return self.db.query("SELECT * FROM incomes ORDER BY expected_date DESC LIMIT ?", (limit,))
+        return self.db.query("SELECT * FROM incomes ORDER BY expected_date DESC")
+    def dashboard_totals(self):
+        # scalar SQL aggregates: SQLite sums in C, no per-row Row objects in Python
+        acc = self.db.query_hot(SQL_TOTALS_ACCOUNTS)[0]
+        exp = self.db.query_hot(SQL_TOTALS_EXPENSES)[0]
+        inc = self.db.query_hot(SQL_TOTALS_INCOMES)[0]
+        return {"total_balance": _from_cents(acc.s), "n_accounts": acc.n,
+                "n_expenses": exp.n, "actual_expense_sum": _from_cents(exp.s),
+                "n_incomes": inc.n, "actual_income_sum": _from_cents(inc.s)}
     def transfer(self,from_id,to_id,amt,currency):
-        f=self.db.query("SELECT * FROM accounts WHERE id=?",(from_id,))[0]
-        t=self.db.query("SELECT * FROM accounts WHERE id=?",(to_id,))[0]
-        debit=self.fx.convert(amt,currency,f["currency"]) if currency!=f["currency"] else amt
-        credit=self.fx.convert(amt,currency,t["currency"]) if currency!=t["currency"] else amt
-        self.update_balance(from_id,f["balance"]-debit)
-        self.update_balance(to_id,t["balance"]+credit)
-        self.db.execute("INSERT INTO transfers VALUES(NULL,?,?,?,?,?)",(from_id,to_id,amt,currency,datetime.utcnow().isoformat()))
+        cents = _to_cents(amt)
+        f_cur=self._get_account_currency(from_id)
+        t_cur=self._get_account_currency(to_id)
+        debit=round(self.fx.convert(cents,currency,f_cur)) if currency!=f_cur else cents
+        credit=round(self.fx.convert(cents,currency,t_cur)) if currency!=t_cur else cents
+        # both balance legs and the journal row land in one atomic commit
+        with self.db.transaction() as c:
+            self._apply_balance_deltas({from_id:-debit, to_id:credit})
+            c.execute("INSERT INTO transfers VALUES(NULL,?,?,?,?,?)",(from_id,to_id,cents,currency,now_iso()))
 
 # ---------------- UI helpers ----------------
-def card(title,value,color="#2a3163"):
-    f=QFrame(); f.setMinimumSize(220,120); f.setMaximumHeight(150)
+_MONEY_FMT = ",.2f"  # thousands separators; shared by every money label
+
+_CARD_FONTS = []
+def _card_fonts():
+    # QFont construction hits the font database; build the two faces once
+    # (lazily — QFont needs a live QApplication) and share them across cards
+    if not _CARD_FONTS:
+        _CARD_FONTS[:] = [QFont("Segoe UI",10,QFont.Bold), QFont("Segoe UI",22,QFont.Bold)]
+    return _CARD_FONTS
+
+def card(title,value,style_id="card-balance"):
+    # returns (frame, value_label) so callers can update the value without rebuilding;
+    # colors come from one parsed theme.qss rule per style_id, not a per-widget stylesheet
+    title_font, value_font = _card_fonts()
+    f=QFrame(); f.setObjectName(style_id); f.setMinimumSize(220,120); f.setMaximumHeight(150)
     layout=QVBoxLayout(f); layout.setContentsMargins(16,12,16,12)
-    t=QLabel(title); t.setFont(QFont("Segoe UI",10, QFont.Bold)); t.setStyleSheet("color:#cfd2ff;")
-    v=QLabel(value); v.setFont(QFont("Segoe UI",22,QFont.Bold)); v.setStyleSheet("color:white;")
+    t=QLabel(title); t.setObjectName("card-title"); t.setFont(title_font)
+    v=QLabel(value); v.setObjectName("card-value"); v.setFont(value_font)
     layout.addWidget(t); layout.addWidget(v)
     shadow=QGraphicsDropShadowEffect(); shadow.setBlurRadius(20); shadow.setOffset(0,6); shadow.setColor(QColor(0,0,0,160))
-    f.setGraphicsEffect(shadow); f.setStyleSheet(f"background-color:{color}; border-radius:12px;")
-    return f
+    f.setGraphicsEffect(shadow)
+    return f, v
+
+class RowsModel(QAbstractTableModel):
+    # QTableView + model paints only visible cells; use instead of QTableWidget,
+    # whose per-cell items rebuild O(total_rows) on every refresh
+    def __init__(self, headers, rows=None, parent=None):
+        super().__init__(parent); self._headers = headers; self._rows = rows or []
+    def rowCount(self, parent=QModelIndex()): return 0 if parent.isValid() else len(self._rows)
+    def columnCount(self, parent=QModelIndex()): return 0 if parent.isValid() else len(self._headers)
+    def data(self, index, role=Qt.DisplayRole):
+        if role == Qt.DisplayRole and index.isValid():
+            return str(self._rows[index.row()][self._headers[index.column()]])
+        if role == Qt.TextAlignmentRole: return int(Qt.AlignLeft | Qt.AlignVCenter)
+        return None
+    def headerData(self, section, orientation, role=Qt.DisplayRole):
+        if role == Qt.DisplayRole and orientation == Qt.Horizontal: return self._headers[section]
+        return None
+    def set_rows(self, new_rows): self._rows = new_rows; self.layoutChanged.emit()
 
 class ChartWidget(QWidget):
-    def __init__(self): super().__init__(); v=QVBoxLayout(self); self.fig=Figure(figsize=(4,2.4)); self.canvas=FigureCanvas(self.fig); v.addWidget(self.canvas)
+    def __init__(self):
+        super().__init__()
+        from matplotlib.figure import Figure
+        from matplotlib.backends.backend_qtagg import FigureCanvasQTAgg as FigureCanvas
+        v=QVBoxLayout(self); self.fig=Figure(figsize=(4,2.4)); self.canvas=FigureCanvas(self.fig); v.addWidget(self.canvas)
+        # axes and line artists are created once; plot() only swaps their data
+        self.ax=self.fig.add_subplot(111)
+        self.line_in,=self.ax.plot([],[],label="Income",color="green")
+        self.line_ex,=self.ax.plot([],[],label="Expenses",color="red")
+        self.ax.legend()
     def plot(self,days,incomes,expenses):
-        self.fig.clear(); ax=self.fig.add_subplot(111)
-        ax.plot(days,incomes,label="Income",color="green"); ax.plot(days,expenses,label="Expenses",color="red")
-        ax.legend(); self.canvas.draw()
+        xs=range(len(days))
+        self.line_in.set_data(xs,incomes); self.line_ex.set_data(xs,expenses)
+        self.ax.set_xticks(list(xs)); self.ax.set_xticklabels(days)
+        self.ax.relim(); self.ax.autoscale_view(); self.canvas.draw_idle()
 
 # ---------------- Pages ----------------
+class _TotalsSignals(QObject):
+    done = Signal(dict)
+
+class TotalsWorker(QRunnable):
+    # runs the dashboard aggregates off the GUI thread on its own connection
+    # (sqlite3 objects must not be shared across threads)
+    def __init__(self, db_path=DB_PATH):
+        super().__init__(); self.db_path = db_path; self.signals = _TotalsSignals()
+    def run(self):
+        try:
+            conn = sqlite3.connect(self.db_path)
+            acc = conn.execute(SQL_TOTALS_ACCOUNTS).fetchone()
+            exp = conn.execute(SQL_TOTALS_EXPENSES).fetchone()
+            inc = conn.execute(SQL_TOTALS_INCOMES).fetchone()
+            conn.close()
+            self.signals.done.emit({"total_balance": _from_cents(acc[1]), "n_accounts": acc[0],
+                                    "n_expenses": exp[0], "actual_expense_sum": _from_cents(exp[1]),
+                                    "n_incomes": inc[0], "actual_income_sum": _from_cents(inc[1])})
+        except Exception:
+            self.signals.done.emit({})
+
 class HomePage(QWidget):
     def __init__(self, finance: FinanceService):
         super().__init__()
@@ -127,59 +384,99 @@ class HomePage(QWidget):
         self.cards_grid = QGridLayout()
         self.layout().addLayout(self.cards_grid)
 
-        # Cashflow chart
-        self.chart = ChartWidget()
-        self.layout().addWidget(self.chart)
+        # Cashflow chart is built on first data arrival so startup never imports matplotlib
+        self.chart = None
+
+        # cards are built once; _reload_data only updates the value labels
+        self._card_balance, self._card_balance_val = card("Total Balance", "0.00", "card-balance")
+        self._card_accounts, self._card_accounts_val = card("Accounts", "0", "card-accounts")
+        self._card_expenses, self._card_expenses_val = card("Expenses", "0", "card-expenses")
+        self._card_incomes, self._card_incomes_val = card("Incomes", "0", "card-incomes")
+        self._cards = [self._card_balance, self._card_accounts,
+                       self._card_expenses, self._card_incomes]
+
+        # resize only re-lays out cards; the DB/chart reload is debounced
+        self._last_per_row = None
+        self._last_totals = None  # last applied values; unchanged refreshes skip setText
+        self._pending = False   # guards against overlapping background reloads
+        self._refresh_timer = QTimer(self)
+        self._refresh_timer.setSingleShot(True)
+        self._refresh_timer.timeout.connect(self._reload_data)
 
         self.refresh()
 
     def refresh(self):
-        # Totals
-        accounts = self.finance.list_accounts()
-        expenses = self.finance.list_expenses()
-        incomes = self.finance.list_incomes()
-
-        total_balance = sum(a["balance"] for a in accounts)
-        c1 = card("Total Balance", f"{total_balance:.2f}", "#2a3163")
-        c2 = card("Accounts", str(len(accounts)), "#1e7a63")
-        c3 = card("Expenses", str(len(expenses)), "#7a1e3a")
-        c4 = card("Incomes", str(len(incomes)), "#1e4a7a")
-
-        cards = [c1, c2, c3, c4]
+        self._reload_data()
 
-        # Clear old cards
-        while self.cards_grid.count():
-            item = self.cards_grid.takeAt(0)
-            w = item.widget()
-            if w:
-                w.setParent(None)
-
-        # Responsive layout
+    def _per_row(self):
         width = self.width()
         if width > 1000:
-            per_row = 4
+            return 4
         elif width > 700:
-            per_row = 2
-        else:
-            per_row = 1
+            return 2
+        return 1
+
+    def _reload_data(self):
+        # aggregates run on a worker thread; the GUI thread only formats strings
+        if self._pending:
+            return
+        self._pending = True
+        worker = TotalsWorker()
+        worker.signals.done.connect(self._apply_totals)
+        QThreadPool.globalInstance().start(worker)
+
+    def _apply_totals(self, t):
+        self._pending = False
+        if not t:
+            return
+        self._relayout_cards(self._per_row())
+
+        # only touch labels/chart whose values actually moved — setText forces a
+        # repaint even when the text is identical, so a no-op refresh stays free
+        new = (format(t["total_balance"], _MONEY_FMT), str(t["n_accounts"]),
+               str(t["n_expenses"]), str(t["n_incomes"]),
+               t["actual_income_sum"], t["actual_expense_sum"])
+        old = self._last_totals
+        if new == old:
+            return
+        labels = (self._card_balance_val, self._card_accounts_val,
+                  self._card_expenses_val, self._card_incomes_val)
+        for lbl, text, prev in zip(labels, new, old or (None,)*4):
+            if text != prev:
+                lbl.setText(text)
+        self._last_totals = new
+
+        if self.chart is None:
+            self.chart = ChartWidget()
+            self.layout().addWidget(self.chart)
+
+        # Simple synthetic chart (replace with real summaries if you like)
+        days = ["D", "W", "M"]
+        incomes_vals = [t["actual_income_sum"]] * 3
+        expenses_vals = [t["actual_expense_sum"]] * 3
+        self.chart.plot(days, incomes_vals, expenses_vals)
+
+    def _relayout_cards(self, per_row):
+        if per_row == self._last_per_row:
+            return
+        self._last_per_row = per_row
+
+        # Detach and re-add the same cached frames; addWidget is a cheap reparent
+        while self.cards_grid.count():
+            self.cards_grid.takeAt(0)
 
         row, col = 0, 0
-        for c in cards:
+        for c in self._cards:
             self.cards_grid.addWidget(c, row, col, alignment=Qt.AlignTop)
             col += 1
             if col >= per_row:
                 col = 0
                 row += 1
 
-        # Simple synthetic chart (replace with real summaries if you like)
-        days = ["D", "W", "M"]
-        incomes_vals = [sum(i["amount"] for i in incomes if not i["is_upcoming"])] * 3
-        expenses_vals = [sum(e["amount"] for e in expenses if not e["is_upcoming"])] * 3
-        self.chart.plot(days, incomes_vals, expenses_vals)
-
     def resizeEvent(self, event):
         super().resizeEvent(event)
-        self.refresh()
+        self._relayout_cards(self._per_row())
+        self._refresh_timer.start(150)
         
         
 class SettingsPage(QWidget):
@@ -270,6 +567,9 @@ class MainWindow(QMainWindow):
         self.income.refresh()
 def main():
     app = QApplication(sys.argv)
+    qss = os.path.join(os.path.dirname(os.path.abspath(__file__)), "assets", "theme.qss")
+    if os.path.exists(qss):
+        with open(qss) as fh: app.setStyleSheet(fh.read())
     w = MainWindow()
     w.show()
     sys.exit(app.exec())